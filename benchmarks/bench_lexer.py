@@ -0,0 +1,59 @@
+"""Benchmark serial vs. parallel lexing of a large generated EduLang file.
+
+Usage:
+  python -m benchmarks.bench_lexer [--size-mb 4] [--repeat 3]
+
+The source is built by repeating `examples/complex_bmi.edl` (which has
+comments and strings) until it reaches the requested size. The parallel
+lexer is timed with 1, 2, 4, ... workers up to the machine's core count and
+its output is checked against the serial lexer.
+"""
+
+import argparse
+import os
+import time
+
+from src.lexer import lex_parallel, lex_serial
+
+EXAMPLE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "examples", "complex_bmi.edl")
+
+
+def build_source(size_mb: float) -> str:
+    with open(EXAMPLE, "r", encoding="utf-8") as f:
+        unit = f.read() + "\n"
+    copies = max(1, int(size_mb * 1024 * 1024) // len(unit))
+    return unit * copies
+
+
+def best_time(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Benchmark parallel lexing")
+    ap.add_argument("--size-mb", type=float, default=4.0, help="Size of the generated source")
+    ap.add_argument("--repeat", type=int, default=3, help="Runs per configuration (best is reported)")
+    args = ap.parse_args(argv)
+
+    code = build_source(args.size_mb)
+    expected = lex_serial(code)
+    print(f"source: {len(code) / 1e6:.1f} MB, {len(expected)} tokens, {os.cpu_count()} cores")
+
+    serial = best_time(lambda: lex_serial(code), args.repeat)
+    print(f"{'serial':>10}: {serial:8.3f}s")
+
+    workers = 1
+    while workers <= (os.cpu_count() or 1):
+        assert lex_parallel(code, workers=workers) == expected
+        t = best_time(lambda: lex_parallel(code, workers=workers), args.repeat)
+        print(f"{workers:>2} workers: {t:8.3f}s  speedup x{serial / t:.2f}")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
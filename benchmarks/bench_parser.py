@@ -0,0 +1,104 @@
+"""Benchmark the Pratt expression parser against the previous left-to-right fold.
+
+Usage:
+  python -m benchmarks.bench_parser [--statements 20000] [--repeat 5]
+
+The old parser had no precedence, so programs needed defensive parentheses
+to mean `a + (b * c)`. The benchmark parses the same program three ways:
+
+- pratt       : the current parser on the unparenthesized source
+- legacy      : the old fold on the same unparenthesized source
+- legacy+()   : the old fold on the parenthesized source users had to write
+
+and reports throughput and the resulting maximum AST depth.
+"""
+
+import argparse
+import time
+
+from src.ast_nodes import BinaryOpNode, BlockNode, AssignmentNode, UnaryOpNode, LiteralNode, IdentifierNode
+from src.lexer import lex_serial
+from src.parser import Parser
+from src.tokens import TokenKind
+
+PLAIN = "r = a + b * c - d / e * f + g * h;\n"
+PARENTHESIZED = "r = ((a + (b * c)) - ((d / e) * f)) + (g * h);\n"
+
+
+class LegacyParser(Parser):
+    """The pre-Pratt expression parser: every OP folded strictly left to right."""
+
+    def parse_expression(self, min_bp=0):
+        left = self.parse_term()
+
+        while self.peek() == TokenKind.OP:
+            op = self.consume()
+            right = self.parse_term()
+            left = BinaryOpNode(left, op, right)
+
+        return left
+
+    def parse_term(self):
+        kind = self.peek()
+
+        if kind == TokenKind.NUMBER:
+            return LiteralNode(int(self.consume()))
+
+        if kind == TokenKind.STRING:
+            return LiteralNode(self.consume())
+
+        if kind == TokenKind.IDENT:
+            return IdentifierNode(self.consume())
+
+        if kind == TokenKind.LPAREN:
+            self.consume()
+            expr = self.parse_expression()
+            self.consume(TokenKind.RPAREN)
+            return expr
+
+        raise SyntaxError(f"Unexpected token: {self.describe()}")
+
+
+def depth(node):
+    if isinstance(node, BlockNode):
+        return 1 + max((depth(s) for s in node.statements), default=0)
+    if isinstance(node, AssignmentNode):
+        return 1 + depth(node.expr)
+    if isinstance(node, BinaryOpNode):
+        return 1 + max(depth(node.left), depth(node.right))
+    if isinstance(node, UnaryOpNode):
+        return 1 + depth(node.operand)
+    return 1
+
+
+def bench(parser_cls, tokens, repeat):
+    best = float("inf")
+    ast = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        ast = parser_cls(tokens).parse()
+        best = min(best, time.perf_counter() - start)
+    return best, ast
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Benchmark expression parsing")
+    ap.add_argument("--statements", type=int, default=20000, help="Number of generated assignments")
+    ap.add_argument("--repeat", type=int, default=5, help="Runs per configuration (best is reported)")
+    args = ap.parse_args(argv)
+
+    plain = lex_serial(PLAIN * args.statements)
+    parenthesized = lex_serial(PARENTHESIZED * args.statements)
+
+    for name, parser_cls, tokens in (
+        ("pratt", Parser, plain),
+        ("legacy", LegacyParser, plain),
+        ("legacy+()", LegacyParser, parenthesized),
+    ):
+        t, ast = bench(parser_cls, tokens, args.repeat)
+        rate = len(tokens) / t / 1e6
+        print(f"{name:>10}: {t:7.3f}s  {rate:5.2f} Mtok/s  {len(tokens):>8} tokens  depth {depth(ast)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Benchmark running one compiled Program over many envs from a thread pool.
+
+Usage:
+  python -m benchmarks.bench_program [--runs 2000] [--threads 1,2,4,8]
+
+`compile_program` is called once; every run gets its own interpreter frame.
+On a standard CPython build the GIL serializes the runs, so this mostly
+shows that sharing is safe and cheap; on a free-threaded build
+(`python3.13t`, GIL disabled) the runs execute in parallel.
+"""
+
+import argparse
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from src.program import compile_program
+
+SOURCE = """
+{
+    height_m = height / 100;
+    bmi = weight / (height_m * height_m);
+    if (bmi < 18) {
+        print(format("{:.1f} Underweight", bmi));
+    } else {
+        if (bmi < 25) {
+            print(format("{:.1f} Normal weight", bmi));
+        } else {
+            print(format("{:.1f} Overweight", bmi));
+        }
+    }
+}
+"""
+
+
+def gil_enabled() -> bool:
+    check = getattr(sys, "_is_gil_enabled", None)
+    return True if check is None else check()
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Benchmark concurrent Program.run")
+    ap.add_argument("--runs", type=int, default=2000, help="Number of envs to run")
+    ap.add_argument("--threads", default="1,2,4,8", help="Comma-separated thread counts")
+    args = ap.parse_args(argv)
+
+    program = compile_program(SOURCE, known_globals={"weight", "height"})
+    envs = [{"weight": 50 + i % 60, "height": 150 + i % 50} for i in range(args.runs)]
+
+    def run(env):
+        out = []
+        program.run(env, output=out.append)
+        return out[0]
+
+    expected = [run(env) for env in envs]
+    print(f"{args.runs} runs, GIL {'enabled' if gil_enabled() else 'disabled'}")
+
+    base = None
+    for threads in (int(t) for t in args.threads.split(",")):
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            start = time.perf_counter()
+            results = list(pool.map(run, envs))
+            elapsed = time.perf_counter() - start
+        assert results == expected
+        base = base or elapsed
+        print(f"{threads:>3} threads: {elapsed:7.3f}s  {args.runs / elapsed:9.0f} runs/s  speedup x{base / elapsed:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""Runtime array values for EduLang.
+
+Arrays are backed by Python's `array` module so their elements are stored
+as packed machine numbers rather than a list of Python objects. Binary
+operators involving an array are applied element-wise as a single bulk
+operation (`map` over the packed buffers with an `operator` function), so
+the interpreter dispatches once per expression instead of once per element.
+
+Typecodes used:
+- `'q'` : integer arrays (literals, `+ - *` on integer arrays)
+- `'d'` : float arrays (any float element, or the result of `/`)
+- `'b'` : boolean arrays (results of comparisons and equality)
+
+Unlike EduLang numbers, array elements are fixed-size machine values, so an
+integer element outside the 64-bit range raises `RuntimeError`.
+"""
+
+import operator
+from array import array
+from itertools import repeat
+
+
+ARITHMETIC_OPS = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": operator.truediv,
+}
+
+COMPARISON_OPS = {
+    ">": operator.gt,
+    "<": operator.lt,
+    ">=": operator.ge,
+    "<=": operator.le,
+    "==": operator.eq,
+    "!=": operator.ne,
+}
+
+
+class EduArray(array):
+    """A packed numeric array that prints like an EduLang list literal."""
+
+    def __getitem__(self, index):
+        value = array.__getitem__(self, index)
+        if self.typecode == "b":
+            return bool(value)
+        return value
+
+    def __str__(self):
+        return "[" + ", ".join(str(self[i]) for i in range(len(self))) + "]"
+
+    __repr__ = __str__
+
+
+def _build(typecode, values):
+    try:
+        return EduArray(typecode, values)
+    except OverflowError:
+        raise RuntimeError(
+            "Array element out of range: arrays hold 64-bit integers or floats"
+        ) from None
+
+
+def _is_number(value):
+    return isinstance(value, (int, float))
+
+
+def make_array(values):
+    """Build an `EduArray` from an iterable of numbers."""
+    values = list(values)
+    for v in values:
+        if not _is_number(v):
+            raise RuntimeError(f"Array elements must be numbers, got {v!r}")
+    if any(isinstance(v, float) for v in values):
+        return _build("d", values)
+    return _build("q", values)
+
+
+def _result_typecode(op, left, right):
+    if op in COMPARISON_OPS:
+        return "b"
+    if op == "/":
+        return "d"
+    for side in (left, right):
+        if isinstance(side, EduArray):
+            if side.typecode == "d":
+                return "d"
+        elif isinstance(side, float):
+            return "d"
+    return "q"
+
+
+def elementwise(op, left, right):
+    """Apply binary operator `op` element-wise; scalars are broadcast."""
+    fn = ARITHMETIC_OPS.get(op) or COMPARISON_OPS.get(op)
+    if fn is None:
+        raise RuntimeError(f"Unknown operator: {op}")
+
+    left_is_array = isinstance(left, EduArray)
+    right_is_array = isinstance(right, EduArray)
+
+    if left_is_array and right_is_array:
+        if len(left) != len(right):
+            raise RuntimeError(
+                f"Operator '{op}' on arrays of different lengths: {len(left)} vs {len(right)}"
+            )
+        values = map(fn, left, right)
+    elif left_is_array:
+        if not _is_number(right):
+            raise RuntimeError(f"Operator '{op}' requires numeric operands; got array, {right!r}")
+        values = map(fn, left, repeat(right, len(left)))
+    else:
+        if not _is_number(left):
+            raise RuntimeError(f"Operator '{op}' requires numeric operands; got {left!r}, array")
+        values = map(fn, repeat(left, len(right)), right)
+
+    return _build(_result_typecode(op, left, right), values)
+
+
+def negate(arr):
+    """Element-wise unary minus."""
+    typecode = "d" if arr.typecode == "d" else "q"
+    return _build(typecode, map(operator.neg, arr))
+
+
+def index_array(arr, index):
+    """Return `arr[index]`, raising `RuntimeError` for bad indexes."""
+    if not isinstance(arr, EduArray):
+        raise RuntimeError(f"Cannot index non-array value: {arr!r}")
+    if not isinstance(index, int) or isinstance(index, bool):
+        raise RuntimeError(f"Array index must be an integer, got {index!r}")
+    if index < 0 or index >= len(arr):
+        raise RuntimeError(f"Array index {index} out of range for length {len(arr)}")
+    return arr[index]
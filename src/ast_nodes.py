@@ -3,37 +3,113 @@
 These classes represent the concrete syntax tree nodes produced by the parser.
 They are deliberately lightweight data containers so passes (semantic, interp)
 can pattern-match on node types and access their fields.
+
+Expression nodes also carry `static_type`, the type inferred by semantic
+analysis (`None` until analyzed). `evaluate` is a specialized evaluator that
+`interpreter.specialize` attaches to expressions whose types are fully known;
+the interpreter calls it instead of dispatching on the node type.
 """
 
 class PrintNode:
+    evaluate = None
+
     def __init__(self, expr):
         self.expr = expr
 
 class IfNode:
+    evaluate = None
+
     def __init__(self, condition, then_block, else_block):
         self.condition = condition
         self.then_block = then_block
         self.else_block = else_block
 
 class BlockNode:
+    evaluate = None
+
     def __init__(self, statements):
         self.statements = statements
 
 class BinaryOpNode:
+    evaluate = None
+
     def __init__(self, left, op, right):
         self.left = left
         self.op = op
         self.right = right
+        self.static_type = None
+
+class UnaryOpNode:
+    evaluate = None
+
+    def __init__(self, op, operand):
+        self.op = op
+        self.operand = operand
+        self.static_type = None
 
 class LiteralNode:
+    evaluate = None
+
     def __init__(self, value):
         self.value = value
+        self.static_type = None
 
 class IdentifierNode:
+    evaluate = None
+
     def __init__(self, name):
         self.name = name
+        self.static_type = None
 
 class AssignmentNode:
+    evaluate = None
+
     def __init__(self, name, expr):
         self.name = name
         self.expr = expr
+
+class ArrayLiteralNode:
+    evaluate = None
+
+    def __init__(self, elements):
+        self.elements = elements
+        self.static_type = None
+
+class IndexNode:
+    evaluate = None
+
+    def __init__(self, target, index):
+        self.target = target
+        self.index = index
+        self.static_type = None
+
+class CallNode:
+    evaluate = None
+
+    def __init__(self, name, args):
+        self.name = name
+        self.args = args
+        # builtin callable, filled in by semantic analysis
+        self.func = None
+        self.static_type = None
+
+
+def children(node):
+    """Return the child nodes of `node`, in evaluation order."""
+    if isinstance(node, BlockNode):
+        return node.statements
+    if isinstance(node, IfNode):
+        return [c for c in (node.condition, node.then_block, node.else_block) if c is not None]
+    if isinstance(node, (PrintNode, AssignmentNode)):
+        return [node.expr]
+    if isinstance(node, BinaryOpNode):
+        return [node.left, node.right]
+    if isinstance(node, UnaryOpNode):
+        return [node.operand]
+    if isinstance(node, IndexNode):
+        return [node.target, node.index]
+    if isinstance(node, ArrayLiteralNode):
+        return node.elements
+    if isinstance(node, CallNode):
+        return node.args
+    return []
@@ -0,0 +1,110 @@
+"""Common-subexpression elimination for EduLang.
+
+Works on hash-consed ASTs (`Parser(tokens, hash_cons=True)`), where every
+repeated expression is one shared node object:
+
+- `find_common_subexpressions` walks the program and returns the compound
+  expression nodes that are evaluated from more than one place, each with
+  the set of variable names it reads.
+- `CSEInterpreter` caches the value of those nodes. A cached value is reused
+  only while none of the node's variables have been assigned since it was
+  computed; leaving a block counts as an assignment of every name declared
+  in it, because outer bindings become visible again.
+
+All expressions are pure (they read variables but never write them), so the
+only thing that can invalidate a cached value is a change of binding.
+
+`compile_program(source, cse=True)` (and the CLI's `--cse` flag) run this
+pass together with semantic analysis and type specialization.
+"""
+
+from typing import Any, Dict, FrozenSet, Optional
+
+from .ast_nodes import (
+    BinaryOpNode,
+    IdentifierNode,
+    AssignmentNode,
+    ArrayLiteralNode,
+    IndexNode,
+    UnaryOpNode,
+    CallNode,
+    children,
+)
+from .interpreter import Interpreter
+
+
+# builtins are pure, so calls can be cached like any other expression
+COMPOUND_EXPRESSIONS = (BinaryOpNode, UnaryOpNode, IndexNode, ArrayLiteralNode, CallNode)
+
+
+def find_common_subexpressions(ast) -> Dict[Any, FrozenSet[str]]:
+    """Return {node: names read} for compound expressions occurring 2+ times."""
+    counts = {}
+    names = {}
+
+    def free_names(node):
+        if isinstance(node, IdentifierNode):
+            return frozenset([node.name])
+        if node in names:
+            return names[node]
+        result = frozenset().union(*(free_names(c) for c in children(node)))
+        if isinstance(node, COMPOUND_EXPRESSIONS):
+            names[node] = result
+        return result
+
+    stack = [ast]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, COMPOUND_EXPRESSIONS):
+            counts[node] = counts.get(node, 0) + 1
+        stack.extend(children(node))
+
+    return {node: free_names(node) for node, n in counts.items() if n > 1}
+
+
+class CSEInterpreter(Interpreter):
+    def __init__(self, ast, env: Optional[Dict[str, Any]] = None, output=None, common=None):
+        super().__init__(env=env, output=output)
+        # `common` may be precomputed (e.g. by compile_program) and shared
+        self.common = find_common_subexpressions(ast) if common is None else common
+        # node -> (value, clock when computed)
+        self.cache = {}
+        # name -> clock of its last (re)binding
+        self.assigned = {}
+        self.clock = 0
+        self.cache_hits = 0
+
+    def rebind(self, name):
+        self.clock += 1
+        self.assigned[name] = self.clock
+
+    def exit_block(self):
+        if self.block_depth > 1:
+            for name in self.env.scopes[-1]:
+                self.rebind(name)
+        super().exit_block()
+
+    def eval(self, node):
+        reads = self.common.get(node)
+        if reads is None:
+            result = super().eval(node)
+            if isinstance(node, AssignmentNode):
+                self.rebind(node.name)
+            return result
+
+        cached = self.cache.get(node)
+        if cached is not None:
+            value, stamp = cached
+            if all(self.assigned.get(name, 0) <= stamp for name in reads):
+                self.cache_hits += 1
+                return value
+
+        value = super().eval(node)
+        self.cache[node] = (value, self.clock)
+        return value
+
+
+def interpret_cse(ast, env: Optional[Dict[str, Any]] = None, output=None):
+    """Like `interpret`, reusing values of repeated pure subexpressions."""
+    it = CSEInterpreter(ast, env=env, output=output)
+    return it.eval(ast)
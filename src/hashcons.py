@@ -0,0 +1,40 @@
+"""Hash-consing for EduLang expression nodes.
+
+A `NodeInterner` hands out one shared node object per distinct expression
+structure: building `height_m * height_m` twice returns the same
+`BinaryOpNode` both times. Because children are interned before their
+parents, two subtrees are structurally equal exactly when they are the same
+object, so keys only need the children's `id()`s.
+
+Only expression nodes are interned. Statements (`PrintNode`, `IfNode`,
+`AssignmentNode`, `BlockNode`) are always built fresh, since their position
+in the program matters.
+"""
+
+
+def _key_part(value):
+    if isinstance(value, list):
+        return tuple(id(v) for v in value)
+    if isinstance(value, (int, str)):
+        # type keeps True/1 and "1"/1 apart
+        return (type(value), value)
+    return id(value)
+
+
+class NodeInterner:
+    def __init__(self):
+        # key -> node; holding the node also keeps its children (and so the
+        # ids in the key) alive
+        self.table = {}
+
+    def make(self, cls, *args):
+        """Return the shared `cls(*args)` node, creating it on first use."""
+        key = (cls,) + tuple(_key_part(a) for a in args)
+        node = self.table.get(key)
+        if node is None:
+            node = cls(*args)
+            self.table[key] = node
+        return node
+
+    def __len__(self):
+        return len(self.table)
@@ -7,20 +7,44 @@ Supported nodes:
 - `BlockNode` : execute statements sequentially
 - `PrintNode` : evaluate expression and print its value
 - `IfNode`    : evaluate condition and execute the chosen block
-- `BinaryOpNode`, `LiteralNode`, `IdentifierNode` : evaluate expressions
+- `BinaryOpNode`, `UnaryOpNode`, `LiteralNode`, `IdentifierNode` : evaluate
+  expressions
+- `ArrayLiteralNode`, `IndexNode` : build and index arrays (see `arrays.py`)
+- `CallNode` : call a builtin (see `runtime.py`); uses the callable resolved
+  by semantic analysis, or looks the name up if the AST wasn't analyzed
 
 Runtime environment:
 - The interpreter accepts an `env` dict mapping identifier names to Python
   values (numbers or strings). If an identifier is missing, a `NameError` is
   raised.
 
+Type specialization:
+- After semantic analysis, `specialize(ast)` attaches an `evaluate`
+  function to expressions whose types are fully known: literals return a
+  precomputed value, and operators call e.g. `operator.add` for
+  number + number or `operator.eq` for string == string. `eval` calls it
+  before the generic dispatch on node type. Nodes involving `'unknown'`
+  types, such as `--var` globals, and array operations keep the generic
+  path.
+
+Async execution:
+- `run_async` evaluates a program on an asyncio event loop, yielding control
+  every `yield_every` node evaluations. A run can be capped by a step budget
+  and a wall-clock timeout; exceeding either raises a subclass of
+  `ExecutionCancelled`.
+
 Note about strings: the current lexer keeps quotes in string token values
 (e.g. '"hi"'). The interpreter strips these quotes when returning/printing
 string values so host Python strings are used during evaluation.
 """
 
+import asyncio
+import operator
+import time
 from typing import Any, Dict, Optional
 from .scoped import ScopedEnv
+from .arrays import EduArray, elementwise, index_array, make_array, negate
+from .runtime import resolve
 
 
 from .ast_nodes import (
@@ -31,9 +55,108 @@ from .ast_nodes import (
     LiteralNode,
     IdentifierNode,
     AssignmentNode,
+    ArrayLiteralNode,
+    IndexNode,
+    UnaryOpNode,
+    CallNode,
+    children,
 )
 
 
+# Operators whose operand types are fully known, keyed by (left type, op,
+# right type). Anything not listed (arrays, 'unknown' operands from --var
+# globals, ...) takes the generic path in `eval`.
+SPECIALIZED_BINARY_OPS = {}
+for _op, _fn in {
+    "+": operator.add, "-": operator.sub, "*": operator.mul, "/": operator.truediv,
+    ">": operator.gt, "<": operator.lt, ">=": operator.ge, "<=": operator.le,
+    "==": operator.eq, "!=": operator.ne,
+}.items():
+    SPECIALIZED_BINARY_OPS[("number", _op, "number")] = _fn
+for _type in ("string", "bool"):
+    SPECIALIZED_BINARY_OPS[(_type, "==", _type)] = operator.eq
+    SPECIALIZED_BINARY_OPS[(_type, "!=", _type)] = operator.ne
+
+SPECIALIZED_UNARY_OPS = {
+    ("-", "number"): operator.neg,
+}
+
+
+def literal_value(v):
+    """Runtime value of a literal: strings lose their surrounding quotes."""
+    if isinstance(v, str) and len(v) >= 2 and v[0] == '"' and v[-1] == '"':
+        return v[1:-1]
+    return v
+
+
+def _constant(value):
+    def evaluate(interp):
+        return value
+    return evaluate
+
+
+def _variable(name):
+    def evaluate(interp):
+        return interp.env.lookup(name)
+    return evaluate
+
+
+def _unary(fn, operand):
+    def evaluate(interp):
+        return fn(interp.eval(operand))
+    return evaluate
+
+
+def _binary(fn, left, right):
+    def evaluate(interp):
+        return fn(interp.eval(left), interp.eval(right))
+    return evaluate
+
+
+def specialize(ast):
+    """Attach specialized evaluators using types from semantic analysis.
+
+    Must run after `SemanticAnalyzer.analyze(ast)`; nodes it has not typed,
+    or typed `'unknown'` or `'array'`, are left on the generic path.
+    Children are still evaluated through `interp.eval`, so interpreter
+    subclasses (step counting, CSE caching) see every node.
+    """
+    seen = set()
+    stack = [ast]
+    while stack:
+        node = stack.pop()
+        # hash-consed nodes may be reached more than once
+        if id(node) in seen:
+            continue
+        seen.add(id(node))
+
+        if isinstance(node, BinaryOpNode):
+            fn = SPECIALIZED_BINARY_OPS.get((node.left.static_type, node.op, node.right.static_type))
+            if fn is not None:
+                node.evaluate = _binary(fn, node.left, node.right)
+        elif isinstance(node, UnaryOpNode):
+            fn = SPECIALIZED_UNARY_OPS.get((node.op, node.operand.static_type))
+            if fn is not None:
+                node.evaluate = _unary(fn, node.operand)
+        elif isinstance(node, LiteralNode) and node.static_type in ("number", "string"):
+            node.evaluate = _constant(literal_value(node.value))
+        elif isinstance(node, IdentifierNode) and node.static_type in ("number", "string", "bool"):
+            node.evaluate = _variable(node.name)
+
+        stack.extend(children(node))
+    return ast
+
+
+class ExecutionCancelled(RuntimeError):
+    """Raised when a run is stopped before completing."""
+
+
+class StepBudgetExceeded(ExecutionCancelled):
+    pass
+
+
+class DeadlineExceeded(ExecutionCancelled):
+    pass
 
 
 class Interpreter:
@@ -44,23 +167,41 @@ class Interpreter:
         # output is a callable used for printing; default to built-in print
         self.output = output or print
 
+    def enter_block(self):
+        # the outermost block shares the global scope; nested blocks get their own
+        self.block_depth += 1
+        if self.block_depth > 1:
+            self.env.enter_scope()
+
+    def exit_block(self):
+        if self.block_depth > 1:
+            self.env.exit_scope()
+        self.block_depth -= 1
+
+    def condition(self, node):
+        """Evaluate an `if` condition; arrays have no single truth value."""
+        cond = self.eval(node)
+        if isinstance(cond, EduArray):
+            raise RuntimeError(f"If condition must be boolean, got array {cond}")
+        return cond
+
     def eval(self, node):
         """Evaluate an AST node and return its value (or None for statements)."""
-        if isinstance(node, BlockNode):
-            self.block_depth += 1
+        # types known statically: skip the dispatch on node type below
+        evaluate = node.evaluate
+        if evaluate is not None:
+            return evaluate(self)
 
-            if self.block_depth > 1:
-                self.env.enter_scope()
-            try:               
+        if isinstance(node, BlockNode):
+            self.enter_block()
+            try:
                 result = None
                 for stmt in node.statements:
                     result = self.eval(stmt)
                 return result
             finally:
-                if self.block_depth > 1:
-                    self.env.exit_scope()
-                self.block_depth -= 1
-            
+                self.exit_block()
+
         if isinstance(node, PrintNode):
             val = self.eval(node.expr)
             # print strings without surrounding quotes
@@ -76,7 +217,7 @@ class Interpreter:
             return val
 
         if isinstance(node, IfNode):
-            cond = self.eval(node.condition)
+            cond = self.condition(node.condition)
             if cond:
                 return self.eval(node.then_block)
             elif node.else_block:
@@ -88,6 +229,10 @@ class Interpreter:
             right = self.eval(node.right)
             op = node.op
 
+            # arrays: one bulk element-wise operation for the whole expression
+            if isinstance(left, EduArray) or isinstance(right, EduArray):
+                return elementwise(op, left, right)
+
             if op == "+":
                 return left + right
             if op == "-":
@@ -113,23 +258,108 @@ class Interpreter:
 
             raise RuntimeError(f"Unknown operator: {op}")
 
+        if isinstance(node, UnaryOpNode):
+            val = self.eval(node.operand)
+            if node.op == "-":
+                if isinstance(val, EduArray):
+                    return negate(val)
+                return -val
+            raise RuntimeError(f"Unknown operator: {node.op}")
+
         if isinstance(node, LiteralNode):
-            v = node.value
-            # numbers are ints already
-            if isinstance(v, int):
-                return v
-            # strip surrounding quotes for strings
-            if isinstance(v, str):
-                if len(v) >= 2 and v[0] == '"' and v[-1] == '"':
-                    return v[1:-1]
-                return v
-            return v
+            return literal_value(node.value)
 
         if isinstance(node, IdentifierNode):
             return self.env.lookup(node.name)
 
+        if isinstance(node, ArrayLiteralNode):
+            return make_array(self.eval(e) for e in node.elements)
+
+        if isinstance(node, IndexNode):
+            target = self.eval(node.target)
+            index = self.eval(node.index)
+            return index_array(target, index)
+
+        if isinstance(node, CallNode):
+            func = node.func or resolve(node.name)
+            return func(*[self.eval(a) for a in node.args])
+
         raise RuntimeError(f"Interpreter cannot handle node: {node!r}")
 
+class AsyncInterpreter(Interpreter):
+    """Interpreter that counts node evaluations and runs cooperatively.
+
+    Every call to `eval` is one step. Statements are driven by the `run`
+    coroutine, which awaits the event loop between statements once at least
+    `yield_every` steps have passed since the last yield. Expressions are
+    evaluated synchronously, but still count against `step_budget` and the
+    deadline, so a single huge expression cannot overrun either.
+    """
+
+    def __init__(
+        self,
+        env: Optional[Dict[str, Any]] = None,
+        output=None,
+        step_budget: Optional[int] = None,
+        yield_every: int = 1000,
+        timeout: Optional[float] = None,
+    ):
+        super().__init__(env=env, output=output)
+        if yield_every < 1:
+            raise ValueError("yield_every must be at least 1")
+        self.step_budget = step_budget
+        self.yield_every = yield_every
+        self.deadline = None if timeout is None else time.monotonic() + timeout
+        self.steps = 0
+        self.next_yield = yield_every
+        self.next_check = yield_every
+
+    def step(self):
+        self.steps += 1
+        if self.step_budget is not None and self.steps > self.step_budget:
+            raise StepBudgetExceeded(f"Step budget of {self.step_budget} exceeded")
+        # reading the clock every step is too costly; check at yield granularity
+        if self.steps >= self.next_check:
+            self.next_check = self.steps + self.yield_every
+            self.check_deadline()
+
+    def eval(self, node):
+        self.step()
+        return super().eval(node)
+
+    def check_deadline(self):
+        if self.deadline is not None and time.monotonic() > self.deadline:
+            raise DeadlineExceeded(f"Deadline exceeded after {self.steps} steps")
+
+    async def run(self, node):
+        """Evaluate `node`, yielding to the event loop between statements."""
+        if isinstance(node, BlockNode):
+            self.step()
+            self.enter_block()
+            try:
+                result = None
+                for stmt in node.statements:
+                    result = await self.run(stmt)
+                return result
+            finally:
+                self.exit_block()
+
+        if isinstance(node, IfNode):
+            self.step()
+            if self.condition(node.condition):
+                return await self.run(node.then_block)
+            elif node.else_block:
+                return await self.run(node.else_block)
+            return None
+
+        result = self.eval(node)
+        if self.steps >= self.next_yield:
+            self.next_yield = self.steps + self.yield_every
+            await asyncio.sleep(0)
+            # time spent waiting for the loop counts against the deadline too
+            self.check_deadline()
+        return result
+
 
 def interpret(ast, env: Optional[Dict[str, Any]] = None, output=None):
     """Convenience function: create an Interpreter and run `ast`."""
@@ -137,5 +367,29 @@ def interpret(ast, env: Optional[Dict[str, Any]] = None, output=None):
     return it.eval(ast)
 
 
+async def run_async(
+    ast,
+    env: Optional[Dict[str, Any]] = None,
+    *,
+    step_budget: Optional[int] = None,
+    yield_every: int = 1000,
+    timeout: Optional[float] = None,
+    output=None,
+):
+    """Run `ast` on the current event loop without blocking it.
+
+    Raises `StepBudgetExceeded` after `step_budget` node evaluations and
+    `DeadlineExceeded` once `timeout` seconds have elapsed.
+    """
+    it = AsyncInterpreter(
+        env=env,
+        output=output,
+        step_budget=step_budget,
+        yield_every=yield_every,
+        timeout=timeout,
+    )
+    return await it.run(ast)
+
+
 
 
@@ -1,5 +1,11 @@
 # just a start for lexer
+import bisect
+import os
 import re
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+from .tokens import TokenBuffer, TokenKind
 
 # TOKEN TYPES
 TOKEN_TYPES = [
@@ -15,44 +21,143 @@ TOKEN_TYPES = [
     ("RPAREN",      r"\)"),
     ("LBRACE",      r"\{"),
     ("RBRACE",      r"\}"),
+    ("LBRACKET",    r"\["),
+    ("RBRACKET",    r"\]"),
+    ("COMMA",       r","),
     ("SEMICOLON",   r";"),
     ("WHITESPACE",  r"[ \t\n]+"),
 ]
 
 KEYWORDS = {"if", "else", "print"}
 
+# One alternation of all token patterns, tried in TOKEN_TYPES order at each
+# position (first alternative that matches wins, like trying each pattern in
+# turn). Group T<i> corresponds to TOKEN_TYPES[i].
+_MASTER = re.compile("|".join(f"(?P<T{i}>{pattern})" for i, (_, pattern) in enumerate(TOKEN_TYPES)))
+
+# group name -> TokenKind, or None for skipped whitespace/comments
+_GROUP_KINDS = {
+    f"T{i}": None if name in ("WHITESPACE", "COMMENT") else TokenKind[name]
+    for i, (name, _) in enumerate(TOKEN_TYPES)
+}
+
+# sources at least this many characters long are lexed in parallel chunks
+PARALLEL_THRESHOLD = 1_000_000
+
+# smallest chunk handed to a worker; below this process overhead dominates
+MIN_CHUNK_SIZE = 256 * 1024
+
+# spans a chunk boundary must never fall inside (same patterns as the lexer)
+_NO_SPLIT = re.compile(r'"([^"\\]|\\.)*"|//[^\n]*|/\*[\s\S]*?\*/')
+
 # LEXER FUNCTION
 def lexer(code):
-    tokens = []
+    """Return the tokens of `code` as `(type_name, text)` tuples."""
+    return tokenize(code).to_pairs()
+
+
+def tokenize(code):
+    """Return the tokens of `code` as a `TokenBuffer` (see tokens.py)."""
+    if len(code) >= PARALLEL_THRESHOLD and (os.cpu_count() or 1) > 1:
+        return lex_parallel(code)
+    return lex_serial(code)
+
+
+def _scan(code, offset=0):
+    """Lex `code` into `(kinds, starts, ends)` arrays.
+
+    `offset` is the absolute position of `code` in the full source; it is
+    added to every start/end and to error indexes, so chunks lexed on their
+    own report positions in the whole file.
+    """
+    kinds = array("B")
+    starts = array("q")
+    ends = array("q")
+    match = _MASTER.match
     index = 0
-    
+
     while index < len(code):
-        match_found = False
-
-        for token_type, pattern in TOKEN_TYPES:
-            regex = re.compile(pattern)
-            match = regex.match(code, index)
-
-            if match:
-                text = match.group(0)
-                
-                # now skips both whitespace and comments
-                if token_type == "WHITESPACE" or token_type == "COMMENT":
-                    index += len(text)
-                    match_found = True
-                    break
-
-                # convert identifiers into keywords
-                if token_type == "IDENT" and text in KEYWORDS:
-                    tokens.append(("KEYWORD", text))
-                else:
-                    tokens.append((token_type, text))
-
-                index += len(text)
-                match_found = True
-                break
-
-        if not match_found:
-            raise SyntaxError(f"Illegal character at index {index}: {code[index]}")
-
-    return tokens
+        m = match(code, index)
+        if m is None:
+            raise SyntaxError(f"Illegal character at index {offset + index}: {code[index]}")
+
+        end = m.end()
+        kind = _GROUP_KINDS[m.lastgroup]
+        # skips both whitespace and comments
+        if kind is not None:
+            # convert identifiers into keywords
+            if kind == TokenKind.IDENT and code[index:end] in KEYWORDS:
+                kind = TokenKind.KEYWORD
+            kinds.append(kind)
+            starts.append(offset + index)
+            ends.append(offset + end)
+        index = end
+
+    return kinds, starts, ends
+
+
+def lex_serial(code):
+    """Lex `code` on the current core."""
+    return TokenBuffer(code, *_scan(code))
+
+
+def find_split_points(code, chunk_size):
+    """Return chunk boundaries for `code`, each roughly `chunk_size` apart.
+
+    Boundaries are placed just after a newline that is outside every string
+    literal and comment. Newlines never occur inside other tokens, so the
+    serial lexer is always at a token boundary there, and lexing each chunk
+    independently yields exactly the serial token stream.
+    """
+    spans = [m.span() for m in _NO_SPLIT.finditer(code)]
+    starts = [start for start, _ in spans]
+
+    points = [0]
+    target = chunk_size
+    while target < len(code):
+        newline = code.find("\n", target)
+        if newline == -1:
+            break
+        # is the newline inside a string/comment span?
+        i = bisect.bisect_right(starts, newline) - 1
+        if i >= 0 and spans[i][0] <= newline < spans[i][1]:
+            target = spans[i][1]
+            continue
+        points.append(newline + 1)
+        target = newline + 1 + chunk_size
+    points.append(len(code))
+    return points
+
+
+def _lex_chunk(args):
+    chunk, offset = args
+    return _scan(chunk, offset)
+
+
+def lex_parallel(code, workers=None, chunk_size=None):
+    """Lex `code` in chunks across a process pool.
+
+    Produces the same `TokenBuffer` (and the same first error) as
+    `lex_serial`. Workers return packed arrays with absolute offsets, so
+    stitching is a plain concatenation.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        return lex_serial(code)
+    if chunk_size is None:
+        chunk_size = max(MIN_CHUNK_SIZE, -(-len(code) // workers))
+
+    points = find_split_points(code, chunk_size)
+    jobs = [(code[start:end], start) for start, end in zip(points, points[1:])]
+    if len(jobs) <= 1:
+        return lex_serial(code)
+
+    buf = TokenBuffer(code)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # map yields results in chunk order, so the earliest chunk's error
+        # is the one raised, matching the serial lexer
+        for kinds, starts, ends in pool.map(_lex_chunk, jobs):
+            buf.kinds.extend(kinds)
+            buf.starts.extend(starts)
+            buf.ends.extend(ends)
+    return buf
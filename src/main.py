@@ -1,11 +1,12 @@
 """CLI runner for EduLang programs.
 
 Usage:
-  python -m src.main path/to/program.edl [--var name=value ...] [--strict]
+  python -m src.main path/to/program.edl [--var name=value ...] [--strict] [--cse]
 
 This script reads the given file, runs the lexer, parser, optional semantic
 check, and then executes the program with the interpreter. Use `--var` to
-provide runtime variables (e.g. `--var age=20`).
+provide runtime variables (e.g. `--var age=20`, `--var height=1.75`);
+comma-separated numbers become arrays (e.g. `--var weights=60,72,85`).
 
 Assignment operator now works, so variables can now be defined in test code.
 See test/edulang_file_test_0.txt for an example.
@@ -15,10 +16,36 @@ import argparse
 import sys
 from typing import Dict
 
-from .lexer import lexer
-from .parser import Parser
-from .semantic import SemanticAnalyzer, SemanticError
-from .interpreter import interpret
+from .semantic import SemanticError
+from .program import compile_program
+from .arrays import make_array
+
+
+def parse_number(text: str):
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
+def parse_value(val: str) -> object:
+    """Coerce a `--var` value: number, comma-separated numeric array, else string.
+
+    Numbers follow the same rule as array elements: int if possible, else float.
+    """
+    try:
+        return parse_number(val)
+    except ValueError:
+        pass
+    if "," in val:
+        try:
+            return make_array(parse_number(item) for item in val.split(","))
+        except ValueError:
+            pass
+        except RuntimeError as e:
+            # numeric but not storable in an array (e.g. beyond 64 bits)
+            raise ValueError(f"Invalid array value: {val}. {e}")
+    return val
 
 
 def parse_vars(pairs) -> Dict[str, object]:
@@ -27,29 +54,22 @@ def parse_vars(pairs) -> Dict[str, object]:
         if "=" not in p:
             raise ValueError(f"Invalid var assignment: {p}. Expect name=value")
         name, val = p.split("=", 1)
-        # try to coerce to int, else keep as string
-        try:
-            env[name] = int(val)
-        except ValueError:
-            env[name] = val
+        # try to coerce to a number or an array of numbers, else keep as string
+        env[name] = parse_value(val)
     return env
 
 
-def run_file(path: str, env: Dict[str, object], strict: bool):
+def run_file(path: str, env: Dict[str, object], strict: bool, cse: bool = False):
     with open(path, "r", encoding="utf-8") as f:
         code = f.read()
 
-    tokens = lexer(code)
-    ast = Parser(tokens).parse()
-
-    analyzer = SemanticAnalyzer(strict=strict)
     try:
-        analyzer.analyze(ast)
+        program = compile_program(code, known_globals=set(env), strict=strict, cse=cse)
     except SemanticError as e:
         print(f"Semantic error: {e}")
         return 2
 
-    interpret(ast, env=env, output=print)
+    program.run(env=env, output=print)
     return 0
 
 
@@ -59,6 +79,7 @@ def main(argv=None):
     ap.add_argument("file", help="EduLang source file to run")
     ap.add_argument("--var", action="append", default=[], help="Provide runtime var as name=value (can repeat)")
     ap.add_argument("--strict", action="store_true", help="Enable strict semantic checking for undefined identifiers")
+    ap.add_argument("--cse", action="store_true", help="Reuse values of repeated subexpressions (common-subexpression elimination)")
 
     args = ap.parse_args(argv)
     try:
@@ -67,7 +88,7 @@ def main(argv=None):
         print(e)
         return 2
 
-    return run_file(args.file, env=env, strict=args.strict)
+    return run_file(args.file, env=env, strict=args.strict, cse=args.cse)
 
 
 if __name__ == "__main__":
@@ -9,34 +9,124 @@ from .ast_nodes import (
     LiteralNode,
     IdentifierNode,
     AssignmentNode,
+    ArrayLiteralNode,
+    IndexNode,
+    UnaryOpNode,
+    CallNode,
 )
+from .hashcons import NodeInterner
+from .tokens import TokenBuffer, TokenKind
+
+# token kinds as plain ints: comparing ints is cheaper than comparing enums
+
+NUMBER = int(TokenKind.NUMBER)
+STRING = int(TokenKind.STRING)
+IDENT = int(TokenKind.IDENT)
+KEYWORD = int(TokenKind.KEYWORD)
+OP = int(TokenKind.OP)
+LPAREN = int(TokenKind.LPAREN)
+RPAREN = int(TokenKind.RPAREN)
+LBRACE = int(TokenKind.LBRACE)
+RBRACE = int(TokenKind.RBRACE)
+LBRACKET = int(TokenKind.LBRACKET)
+RBRACKET = int(TokenKind.RBRACKET)
+COMMA = int(TokenKind.COMMA)
+SEMICOLON = int(TokenKind.SEMICOLON)
+
+
+# OPERATOR TABLE
+# Binding powers: higher binds tighter. Left-associative operators parse
+# their right operand at bp + 1, right-associative ones at bp.
+LEFT = "left"
+RIGHT = "right"
+
+INFIX_OPERATORS = {
+    "==": (10, LEFT),
+    "!=": (10, LEFT),
+    ">":  (20, LEFT),
+    "<":  (20, LEFT),
+    ">=": (20, LEFT),
+    "<=": (20, LEFT),
+    "+":  (30, LEFT),
+    "-":  (30, LEFT),
+    "*":  (40, LEFT),
+    "/":  (40, LEFT),
+}
+
+PREFIX_OPERATORS = {
+    "-": 50,
+}
 
 
 # PARSER CLASS
 
+def build_node(cls, *args):
+    return cls(*args)
+
+
 class Parser:
-    def __init__(self, tokens):
+    def __init__(self, tokens, hash_cons=False):
+        # the parser reads a TokenBuffer directly; legacy (type, text) lists
+        # from lexer() are packed into one first
+        if not isinstance(tokens, TokenBuffer):
+            tokens = TokenBuffer.from_pairs(tokens)
         self.tokens = tokens
+        self.kinds = tokens.kinds
+        self.count = len(tokens.kinds)
         self.index = 0
+        # expression node factory; with hash_cons=True structurally identical
+        # expressions share one node object (see hashcons.py)
+        self.interner = NodeInterner() if hash_cons else None
+        self.node = self.interner.make if hash_cons else build_node
+        # expression parselets dispatched on the kind of token that starts them
+        self.prefix_parselets = {
+            NUMBER: self.parse_number,
+            STRING: self.parse_string,
+            IDENT: self.parse_identifier,
+            LPAREN: self.parse_group,
+            LBRACKET: self.parse_array,
+            OP: self.parse_prefix_op,
+        }
 
     # Utility
     def peek(self):
-        return self.tokens[self.index] if self.index < len(self.tokens) else None
+        """Kind of the current token, or None at end of input."""
+        return self.kinds[self.index] if self.index < self.count else None
 
     def peek_next(self):
         nxt = self.index + 1
-        return self.tokens[nxt] if nxt < len(self.tokens) else None
+        return self.kinds[nxt] if nxt < self.count else None
 
-    def consume(self, expected_type=None):
-        token = self.peek()
-        if not token:
-            raise SyntaxError("Unexpected end of input")
+    def text(self, offset=0):
+        """Text of the current token (or the one `offset` tokens ahead)."""
+        return self.tokens.text(self.index + offset)
 
-        if expected_type and token[0] != expected_type:
-            raise SyntaxError(f"Expected {expected_type}, got {token}")
+    def describe(self):
+        if self.peek() is None:
+            return "end of input"
+        return f"{TokenKind(self.peek()).name} {self.text()!r}"
 
-        self.index += 1
-        return token
+    def expect(self, kind):
+        """Consume a token that must be of `kind` (punctuation; no text)."""
+        i = self.index
+        if i >= self.count:
+            raise SyntaxError("Unexpected end of input")
+        if self.kinds[i] != kind:
+            raise SyntaxError(f"Expected {TokenKind(kind).name}, got {self.describe()}")
+        self.index = i + 1
+
+    def consume(self, expected_kind=None):
+        """Consume the current token and return its text."""
+        i = self.index
+        if i >= self.count:
+            raise SyntaxError("Unexpected end of input")
+        if expected_kind is not None and self.kinds[i] != expected_kind:
+            raise SyntaxError(f"Expected {TokenKind(expected_kind).name}, got {self.describe()}")
+        self.index = i + 1
+        return self.tokens.text(i)
+
+    def at_keyword(self, word):
+        return self.peek() == KEYWORD and self.text() == word
 
     # Grammar:
     # program → block
@@ -44,8 +134,10 @@ class Parser:
     # statement → print | if | expression ;
     # print → "print" "(" expr ")" ";"
     # if → "if" "(" expr ")" block ("else" block)?
-    # expr → term (OP term)*
-    # term → NUMBER | STRING | IDENT | "(" expr ")"
+    # expr → prefix (infix-op expr | "[" expr "]")*   (see INFIX_OPERATORS)
+    # prefix → NUMBER | STRING | IDENT | call | "(" expr ")" | "-" expr
+    #        | "[" (expr ("," expr)*)? "]"
+    # call → IDENT "(" (expr ("," expr)*)? ")"
 
     def parse(self):
         # Parse top-level as a sequence of statements. If the file contains
@@ -53,7 +145,7 @@ class Parser:
         # behavior). Otherwise return a BlockNode containing all top-level
         # statements.
         statements = []
-        while self.peek():
+        while self.peek() is not None:
             statements.append(self.parse_statement())
 
         if len(statements) == 1 and isinstance(statements[0], BlockNode):
@@ -63,97 +155,158 @@ class Parser:
 
     def parse_block(self):
         statements = []
-        self.consume("LBRACE")
+        self.expect(LBRACE)
 
-        while self.peek() and self.peek()[0] != "RBRACE":
+        while self.peek() is not None and self.peek() != RBRACE:
             statements.append(self.parse_statement())
 
-        self.consume("RBRACE")
+        self.expect(RBRACE)
         return BlockNode(statements)
 
     def parse_statement(self):
-        token = self.peek()
-
-        if token == ("KEYWORD", "print"):
-            return self.parse_print()
+        kind = self.peek()
 
-        if token == ("KEYWORD", "if"):
-            return self.parse_if()
+        if kind == KEYWORD:
+            word = self.text()
+            if word == "print":
+                return self.parse_print()
+            if word == "if":
+                return self.parse_if()
 
-        if token and token[0] == "LBRACE":
+        if kind == LBRACE:
             return self.parse_block()
 
         # assignment: IDENT = expr ;
-        if token and token[0] == "IDENT":
-            next_tok = self.peek_next()
-            if next_tok and next_tok[0] == "OP" and next_tok[1] == "=":
-                # parse assignment
-                name = self.consume()[1]
-                # consume '=' operator
-                op_tok = self.consume()
-                if op_tok[1] != "=":
-                    raise SyntaxError(f"Expected '=', got {op_tok}")
-                expr = self.parse_expression()
-                self.consume("SEMICOLON")
-                return AssignmentNode(name, expr)
+        if kind == IDENT and self.peek_next() == OP and self.text(1) == "=":
+            name = self.consume()
+            self.index += 1  # '='
+            expr = self.parse_expression()
+            self.expect(SEMICOLON)
+            return AssignmentNode(name, expr)
 
         # expression ;
         expr = self.parse_expression()
-        self.consume("SEMICOLON")
+        self.expect(SEMICOLON)
         return expr
 
     def parse_print(self):
         self.consume()  # "print"
-        self.consume("LPAREN")
+        self.expect(LPAREN)
         expr = self.parse_expression()
-        self.consume("RPAREN")
-        self.consume("SEMICOLON")
+        self.expect(RPAREN)
+        self.expect(SEMICOLON)
         return PrintNode(expr)
 
     def parse_if(self):
         self.consume()  # "if"
-        self.consume("LPAREN")
+        self.expect(LPAREN)
         condition = self.parse_expression()
-        self.consume("RPAREN")
+        self.expect(RPAREN)
 
         then_block = self.parse_block()
 
         else_block = None
-        if self.peek() == ("KEYWORD", "else"):
+        if self.at_keyword("else"):
             self.consume()
             else_block = self.parse_block()
 
         return IfNode(condition, then_block, else_block)
 
-    def parse_expression(self):
-        left = self.parse_term()
+    def parse_expression(self, min_bp=0):
+        # Pratt / precedence climbing: parse a prefix form, then keep folding
+        # infix operators that bind at least as tightly as `min_bp`.
+        kind = self.peek()
+        if kind is None:
+            raise SyntaxError("Unexpected end of input")
 
-        while self.peek() and self.peek()[0] == "OP":
-            op = self.consume()[1]
-            right = self.parse_term()
-            left = BinaryOpNode(left, op, right)
+        prefix = self.prefix_parselets.get(kind)
+        if prefix is None:
+            raise SyntaxError(f"Unexpected token: {self.describe()}")
+        left = prefix()
+
+        while True:
+            kind = self.peek()
+
+            # postfix indexing binds tighter than any operator: -a[i] is -(a[i])
+            if kind == LBRACKET:
+                left = self.parse_index(left)
+                continue
+
+            if kind != OP:
+                break
+            op = self.text()
+            entry = INFIX_OPERATORS.get(op)
+            # '=' and unknown operators end the expression
+            if entry is None:
+                break
+            bp, assoc = entry
+            if bp < min_bp:
+                break
+
+            self.index += 1
+            right = self.parse_expression(bp + 1 if assoc == LEFT else bp)
+            left = self.node(BinaryOpNode, left, op, right)
 
         return left
 
-    def parse_term(self):
-        token = self.peek()
+    def parse_number(self):
+        return self.node(LiteralNode, int(self.consume()))
 
-        if token[0] == "NUMBER":
-            self.consume()
-            return LiteralNode(int(token[1]))
+    def parse_string(self):
+        return self.node(LiteralNode, self.consume())
 
-        if token[0] == "STRING":
-            self.consume()
-            return LiteralNode(token[1])
+    def parse_identifier(self):
+        name = self.consume()
+        if self.peek() == LPAREN:
+            return self.parse_call(name)
+        return self.node(IdentifierNode, name)
 
-        if token[0] == "IDENT":
-            self.consume()
-            return IdentifierNode(token[1])
+    def parse_call(self, name):
+        self.expect(LPAREN)
+        args = []
 
-        if token[0] == "LPAREN":
-            self.consume()
-            expr = self.parse_expression()
-            self.consume("RPAREN")
-            return expr
+        if self.peek() is not None and self.peek() != RPAREN:
+            args.append(self.parse_expression())
+            while self.peek() == COMMA:
+                self.index += 1
+                args.append(self.parse_expression())
+
+        self.expect(RPAREN)
+        return self.node(CallNode, name, args)
+
+    def parse_group(self):
+        self.expect(LPAREN)
+        expr = self.parse_expression()
+        self.expect(RPAREN)
+        return expr
 
-        raise SyntaxError(f"Unexpected token: {token}")
+    def parse_prefix_op(self):
+        bp = PREFIX_OPERATORS.get(self.text())
+        if bp is None:
+            raise SyntaxError(f"Unexpected token: {self.describe()}")
+        op = self.consume()
+
+        operand = self.parse_expression(bp)
+        # fold negative number literals so `-5` stays a single node
+        if op == "-" and isinstance(operand, LiteralNode) and isinstance(operand.value, int):
+            return self.node(LiteralNode, -operand.value)
+        return self.node(UnaryOpNode, op, operand)
+
+    def parse_index(self, target):
+        self.expect(LBRACKET)
+        index = self.parse_expression()
+        self.expect(RBRACKET)
+        return self.node(IndexNode, target, index)
+
+    def parse_array(self):
+        self.expect(LBRACKET)
+        elements = []
+
+        if self.peek() is not None and self.peek() != RBRACKET:
+            elements.append(self.parse_expression())
+            while self.peek() == COMMA:
+                self.index += 1
+                elements.append(self.parse_expression())
+
+        self.expect(RBRACKET)
+        return self.node(ArrayLiteralNode, elements)
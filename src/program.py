@@ -0,0 +1,68 @@
+"""Compiled, shareable EduLang programs.
+
+`compile_program(source)` lexes, parses and semantically checks a program
+once and returns an immutable `Program`. All per-run state (scopes, block
+depth, output) lives in the `Interpreter` that `Program.run` creates for
+each call, so one `Program` can be run from many threads at once:
+
+    program = compile_program(source)
+    with ThreadPoolExecutor() as pool:
+        pool.map(lambda env: program.run(env), envs)
+
+The AST is never modified after compilation. Semantic analysis (which
+resolves builtin calls and records inferred types on the nodes) and
+type specialization happen inside `compile_program`, before the `Program`
+is shared. `compile_program(source, cse=True)` also hash-conses the AST and
+finds repeated subexpressions once; each run then caches their values in
+its own frame.
+"""
+
+from types import MappingProxyType
+from typing import Any, Dict, Optional, Set
+
+from .cse import CSEInterpreter, find_common_subexpressions
+from .interpreter import Interpreter, specialize
+from .lexer import tokenize
+from .parser import Parser
+from .semantic import SemanticAnalyzer
+
+
+class Program:
+    __slots__ = ("source", "ast", "common")
+
+    def __init__(self, source: str, ast, common=None):
+        object.__setattr__(self, "source", source)
+        object.__setattr__(self, "ast", ast)
+        # repeated subexpressions found at compile time (None: CSE disabled)
+        object.__setattr__(self, "common", None if common is None else MappingProxyType(common))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Program is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("Program is immutable")
+
+    def run(self, env: Optional[Dict[str, Any]] = None, output=None):
+        """Execute the program with a fresh frame; safe to call concurrently."""
+        if self.common is not None:
+            # the value cache lives in the per-run interpreter
+            return CSEInterpreter(self.ast, env=env, output=output, common=self.common).eval(self.ast)
+        return Interpreter(env=env, output=output).eval(self.ast)
+
+
+def compile_program(
+    source: str,
+    known_globals: Optional[Set[str]] = None,
+    strict: bool = False,
+    cse: bool = False,
+) -> Program:
+    """Lex, parse and check `source`; raises `SyntaxError` or `SemanticError`.
+
+    With `cse=True` the AST is hash-consed and each run reuses the values of
+    repeated pure subexpressions (see cse.py).
+    """
+    ast = Parser(tokenize(source), hash_cons=cse).parse()
+    SemanticAnalyzer(known_globals=known_globals, strict=strict).analyze(ast)
+    specialize(ast)
+    common = find_common_subexpressions(ast) if cse else None
+    return Program(source, ast, common)
@@ -0,0 +1,143 @@
+"""Builtin functions available to EduLang programs.
+
+Each builtin is registered in `BUILTINS` with its Python implementation and
+a signature the semantic analyzer uses for type checking:
+
+- `params`   : one set of accepted type names per parameter (the analyzer's
+  type strings: `'number'`, `'string'`, `'array'`, ...). The last
+  parameter repeats when `variadic=True`.
+- `optional` : how many trailing parameters may be omitted.
+- `returns`  : type name of the result.
+
+`SemanticAnalyzer` resolves every call to the builtin's Python callable and
+stores it on the `CallNode`, so the interpreter calls it directly instead of
+looking the name up on every evaluation.
+
+Arguments of type `'unknown'` (such as `--var` globals) are only checked when
+the builtin runs; a value of the wrong type raises `RuntimeError`.
+"""
+
+import math
+
+from .arrays import EduArray
+
+
+class Builtin:
+    __slots__ = ("name", "func", "params", "returns", "optional", "variadic")
+
+    def __init__(self, name, func, params, returns, optional=0, variadic=False):
+        self.name = name
+        self.func = func
+        self.params = params
+        self.returns = returns
+        self.optional = optional
+        self.variadic = variadic
+
+    def accepts_count(self, n):
+        if n < len(self.params) - self.optional:
+            return False
+        return self.variadic or n <= len(self.params)
+
+    def param_types(self, i):
+        """Accepted types for argument `i` (assumes `accepts_count`)."""
+        return self.params[min(i, len(self.params) - 1)]
+
+
+BUILTINS = {}
+
+
+def builtin(name, params, returns, optional=0, variadic=False):
+    """Decorator registering a Python function as an EduLang builtin."""
+    def register(func):
+        BUILTINS[name] = Builtin(name, func, params, returns, optional, variadic)
+        return func
+    return register
+
+
+def resolve(name):
+    """Return the Python callable for builtin `name`."""
+    entry = BUILTINS.get(name)
+    if entry is None:
+        raise RuntimeError(f"Unknown function: {name}")
+    return entry.func
+
+
+NUMBER = {"number"}
+NUMBERS = {"number", "array"}
+
+
+def _number(name, value):
+    if not isinstance(value, (int, float)):
+        raise RuntimeError(f"'{name}' requires a number, got {value!r}")
+    return value
+
+
+def _values(args):
+    # min(xs) / max(xs) on a single array, or min(a, b, ...) on numbers
+    if len(args) == 1 and isinstance(args[0], EduArray):
+        if not len(args[0]):
+            raise RuntimeError("Cannot take min/max of an empty array")
+        return args[0]
+    for a in args:
+        if isinstance(a, EduArray):
+            raise RuntimeError("min/max take one array or several numbers")
+        _number("min/max", a)
+    return args
+
+
+@builtin("abs", (NUMBER,), "number")
+def edu_abs(x):
+    return abs(_number("abs", x))
+
+
+@builtin("min", (NUMBERS,), "number", variadic=True)
+def edu_min(*args):
+    return min(_values(args))
+
+
+@builtin("max", (NUMBERS,), "number", variadic=True)
+def edu_max(*args):
+    return max(_values(args))
+
+
+@builtin("round", (NUMBER, NUMBER), "number", optional=1)
+def edu_round(x, digits=None):
+    _number("round", x)
+    if digits is None:
+        return round(x)
+    # digits is a 'number', so 4 / 2 == 2.0 must work as 2
+    if isinstance(_number("round", digits), float):
+        if not digits.is_integer():
+            raise RuntimeError(f"round digits must be a whole number, got {digits!r}")
+        digits = int(digits)
+    return round(x, digits)
+
+
+@builtin("sqrt", (NUMBER,), "number")
+def edu_sqrt(x):
+    if _number("sqrt", x) < 0:
+        raise RuntimeError(f"sqrt of negative number: {x}")
+    return math.sqrt(x)
+
+
+@builtin("len", ({"string", "array"},), "number")
+def edu_len(x):
+    if not isinstance(x, (str, EduArray)):
+        raise RuntimeError(f"'len' requires a string or array, got {x!r}")
+    return len(x)
+
+
+@builtin("str", ({"number", "string", "bool", "array"},), "string")
+def edu_str(x):
+    return str(x)
+
+
+@builtin("format", ({"string"}, {"number", "string", "bool", "array"}), "string", optional=1, variadic=True)
+def edu_format(template, *args):
+    """`format("{:.1f} kg", w)`: Python `str.format` on the arguments."""
+    if not isinstance(template, str):
+        raise RuntimeError(f"'format' requires a string template, got {template!r}")
+    try:
+        return template.format(*args)
+    except (IndexError, KeyError, ValueError) as e:
+        raise RuntimeError(f"Bad format string {template!r}: {e}")
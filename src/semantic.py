@@ -4,13 +4,22 @@ This module implements a small, conservative semantic checker that walks the
 AST produced by the parser and performs basic checks:
 
 - Literal typing (number vs string)
+- Array typing: numeric elements, element-wise operators with matching
+  lengths when both lengths are statically known
 - Binary operator type checking (arithmetic, comparisons, equality)
-- `if` condition must be boolean (comparisons/equality produce booleans)
+- `if` condition must be boolean (comparisons/equality produce booleans);
+  conditions of unknown type are allowed
+- Builtin calls: argument count and types checked against the signatures in
+  `runtime.py`; each call is resolved to its Python callable
+- Inferred expression types are attached to the nodes (`static_type`) so
+  the interpreter can specialize evaluation
+- Assigned names are tracked per block scope, matching the interpreter
+  (a nested block's assignments do not change the outer name's type)
 - Optional strict name-resolution: detect use of identifiers that aren't in
   a provided known-names set.
 
 The analyzer is intentionally small and educational. It returns simple type
-strings like `'number'`, `'string'`, `'bool'` or `'unknown'` for nodes, and
+strings like `'number'`, `'string'`, `'bool'`, `'array'` or `'unknown'` for nodes, and
 raises `SemanticError` for definite problems.
 """
 
@@ -24,7 +33,16 @@ from .ast_nodes import (
 	LiteralNode,
 	IdentifierNode,
 	AssignmentNode,
+	ArrayLiteralNode,
+	IndexNode,
+	UnaryOpNode,
+	CallNode,
 )
+from .runtime import BUILTINS
+
+
+# operators that apply element-wise when either operand is an array
+ARRAY_OPS = {"+", "-", "*", "/", ">", "<", ">=", "<=", "==", "!="}
 
 
 class SemanticError(Exception):
@@ -48,15 +66,59 @@ class SemanticAnalyzer:
 		self.strict = strict
 		# symbol table for variables assigned within the analyzed code
 		self.symbols = {}
+		# statically known lengths of array variables (None when unknown)
+		self.array_lengths = {}
+		# (symbols, array_lengths) per scope, mirroring the interpreter's
+		# ScopedEnv: the outermost block shares the global scope and each
+		# nested block gets its own
+		self.scopes = [(self.symbols, self.array_lengths)]
+		self.block_depth = 0
+
+	def enter_block(self):
+		self.block_depth += 1
+		if self.block_depth > 1:
+			self.scopes.append(({}, {}))
+
+	def exit_block(self):
+		if self.block_depth > 1:
+			self.scopes.pop()
+		self.block_depth -= 1
+
+	def declare(self, name, type_, length):
+		symbols, lengths = self.scopes[-1]
+		symbols[name] = type_
+		lengths[name] = length
+
+	def lookup(self, name):
+		"""Return `(type, array_length)` of the innermost binding, or None."""
+		for symbols, lengths in reversed(self.scopes):
+			if name in symbols:
+				return symbols[name], lengths[name]
+		return None
 
 	def analyze(self, node):
 		"""Analyze `node` and return its type as a string.
 
+		The type of every expression is also recorded on the node as
+		`static_type`. A node shared by hash-consing that is inferred with
+		different types in different places is recorded as `'unknown'`.
+
 		Raises `SemanticError` on definite semantic errors.
 		"""
+		node_t = self.analyze_node(node)
+		if node_t is not None:
+			previous = node.static_type
+			node.static_type = node_t if previous in (None, node_t) else "unknown"
+		return node_t
+
+	def analyze_node(self, node):
 		if isinstance(node, BlockNode):
-			for stmt in node.statements:
-				self.analyze(stmt)
+			self.enter_block()
+			try:
+				for stmt in node.statements:
+					self.analyze(stmt)
+			finally:
+				self.exit_block()
 			return None
 
 		if isinstance(node, PrintNode):
@@ -66,12 +128,12 @@ class SemanticAnalyzer:
 		if isinstance(node, AssignmentNode):
 			# evaluate expression type then record variable
 			expr_t = self.analyze(node.expr)
-			self.symbols[node.name] = expr_t
+			self.declare(node.name, expr_t, self.array_length(node.expr))
 			return None
 
 		if isinstance(node, IfNode):
 			cond_type = self.analyze(node.condition)
-			if cond_type != "bool":
+			if cond_type not in {"bool", "unknown"}:
 				raise SemanticError(f"If condition must be boolean, got '{cond_type}'")
 			self.analyze(node.then_block)
 			if node.else_block:
@@ -83,22 +145,42 @@ class SemanticAnalyzer:
 			right_t = self.analyze(node.right)
 			op = node.op
 
+			# arrays: arithmetic, comparisons and equality apply element-wise, with
+			# numbers broadcast across every element
+			if op in ARRAY_OPS and "array" in (left_t, right_t):
+				for t in (left_t, right_t):
+					if t not in {"array", "number", "unknown"}:
+						raise SemanticError(f"Operator '{op}' requires numeric or array operands; got {left_t}, {right_t}")
+				left_len = self.array_length(node.left)
+				right_len = self.array_length(node.right)
+				if left_len is not None and right_len is not None and left_len != right_len:
+					raise SemanticError(f"Operator '{op}' on arrays of different lengths: {left_len} vs {right_len}")
+				return "array"
+
 			# arithmetic
 			if op in {"+", "-", "*", "/"}:
-				if left_t != "number" or right_t != "number":
+				if left_t not in {"number", "unknown"} or right_t not in {"number", "unknown"}:
 					raise SemanticError(f"Operator '{op}' requires numeric operands; got {left_t}, {right_t}")
+				# an unknown operand may turn out to be an array at runtime
+				if "unknown" in (left_t, right_t):
+					return "unknown"
 				return "number"
 
 			# comparisons (numeric)
 			if op in {">", "<", ">=", "<="}:
-				if left_t != "number" or right_t != "number":
+				if left_t not in {"number", "unknown"} or right_t not in {"number", "unknown"}:
 					raise SemanticError(f"Comparison '{op}' requires numeric operands; got {left_t}, {right_t}")
+				if "unknown" in (left_t, right_t):
+					return "unknown"
 				return "bool"
 
 			# equality can compare any two values but types should match when known
 			if op in {"==", "!="}:
 				if left_t != "unknown" and right_t != "unknown" and left_t != right_t:
 					raise SemanticError(f"Equality '{op}' between incompatible types: {left_t} vs {right_t}")
+				# an unknown operand may be an array, making this element-wise
+				if "unknown" in (left_t, right_t):
+					return "unknown"
 				return "bool"
 
 			# assignment token '=' may appear in parser as OP, but parser doesn't
@@ -109,6 +191,14 @@ class SemanticAnalyzer:
 			# unknown operator
 			raise SemanticError(f"Unknown operator: {op}")
 
+		if isinstance(node, UnaryOpNode):
+			operand_t = self.analyze(node.operand)
+			if node.op == "-":
+				if operand_t not in {"number", "array", "unknown"}:
+					raise SemanticError(f"Unary '-' requires a numeric operand; got {operand_t}")
+				return operand_t
+			raise SemanticError(f"Unknown operator: {node.op}")
+
 		if isinstance(node, LiteralNode):
 			v = node.value
 			if isinstance(v, int):
@@ -124,8 +214,9 @@ class SemanticAnalyzer:
 		if isinstance(node, IdentifierNode):
 			name = node.name
 			# first check local symbols recorded from assignments
-			if name in self.symbols:
-				return self.symbols[name]
+			binding = self.lookup(name)
+			if binding is not None:
+				return binding[0]
 			if name in self.known_globals:
 				# we don't know the exact type of globals, treat as unknown
 				return "unknown"
@@ -136,6 +227,51 @@ class SemanticAnalyzer:
 			# conservative.
 			return "unknown"
 
+		if isinstance(node, ArrayLiteralNode):
+			for element in node.elements:
+				elem_t = self.analyze(element)
+				if elem_t not in {"number", "unknown"}:
+					raise SemanticError(f"Array elements must be numbers; got {elem_t}")
+			return "array"
+
+		if isinstance(node, IndexNode):
+			target_t = self.analyze(node.target)
+			index_t = self.analyze(node.index)
+			if target_t not in {"array", "unknown"}:
+				raise SemanticError(f"Cannot index value of type '{target_t}'")
+			if index_t not in {"number", "unknown"}:
+				raise SemanticError(f"Array index must be a number; got {index_t}")
+			return "number"
+
+		if isinstance(node, CallNode):
+			entry = BUILTINS.get(node.name)
+			if entry is None:
+				raise SemanticError(f"Unknown function: {node.name}")
+			if not entry.accepts_count(len(node.args)):
+				raise SemanticError(f"Wrong number of arguments to '{node.name}': {len(node.args)}")
+			for i, arg in enumerate(node.args):
+				arg_t = self.analyze(arg)
+				allowed = entry.param_types(i)
+				if arg_t != "unknown" and arg_t not in allowed:
+					raise SemanticError(f"Argument {i + 1} of '{node.name}' must be {' or '.join(sorted(allowed))}; got {arg_t}")
+			# resolve once here so evaluation calls the builtin directly
+			node.func = entry.func
+			return entry.returns
+
 		# fallback: unrecognized node
 		raise SemanticError(f"Unrecognized AST node: {node!r}")
 
+	def array_length(self, node):
+		"""Return the statically known length of an array expression, or None."""
+		if isinstance(node, ArrayLiteralNode):
+			return len(node.elements)
+		if isinstance(node, IdentifierNode):
+			binding = self.lookup(node.name)
+			return binding[1] if binding is not None else None
+		if isinstance(node, UnaryOpNode):
+			return self.array_length(node.operand)
+		if isinstance(node, BinaryOpNode):
+			left_len = self.array_length(node.left)
+			return left_len if left_len is not None else self.array_length(node.right)
+		return None
+
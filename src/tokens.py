@@ -0,0 +1,111 @@
+"""Token kinds and a compact token stream for EduLang.
+
+Token kinds are small ints (`TokenKind`), so the parser compares integers
+instead of type-name strings.
+
+`TokenBuffer` stores a whole token stream as three parallel `array`s over
+the original source text (struct-of-arrays):
+
+- `kinds`  : one `TokenKind` value per token
+- `starts` : absolute start offset of each token in `source`
+- `ends`   : absolute end offset of each token in `source`
+
+Token text is sliced from the source only when asked for, and identifier
+text is interned so repeated names share one string object. `Parser`
+consumes a `TokenBuffer` directly; `Token` objects and the legacy
+`(type_name, text)` pairs returned by `lexer()` are produced on demand.
+"""
+
+import sys
+from array import array
+from enum import IntEnum
+from typing import NamedTuple
+
+
+class TokenKind(IntEnum):
+    NUMBER = 0
+    STRING = 1
+    IDENT = 2
+    KEYWORD = 3
+    OP = 4
+    LPAREN = 5
+    RPAREN = 6
+    LBRACE = 7
+    RBRACE = 8
+    LBRACKET = 9
+    RBRACKET = 10
+    COMMA = 11
+    SEMICOLON = 12
+
+
+_IDENT = int(TokenKind.IDENT)
+
+
+class Token(NamedTuple):
+    kind: TokenKind
+    text: str
+    start: int
+    end: int
+
+
+class TokenBuffer:
+    __slots__ = ("source", "kinds", "starts", "ends")
+
+    def __init__(self, source, kinds=None, starts=None, ends=None):
+        self.source = source
+        self.kinds = kinds if kinds is not None else array("B")
+        self.starts = starts if starts is not None else array("q")
+        self.ends = ends if ends is not None else array("q")
+
+    @classmethod
+    def from_pairs(cls, pairs):
+        """Build a buffer from legacy `(type_name, text)` pairs.
+
+        The pairs carry no positions, so the source is rebuilt by joining
+        the token texts with single spaces.
+        """
+        buf = cls("")
+        parts = []
+        pos = 0
+        for type_name, text in pairs:
+            buf.append(TokenKind[type_name], pos, pos + len(text))
+            parts.append(text)
+            pos += len(text) + 1
+        buf.source = " ".join(parts)
+        return buf
+
+    def append(self, kind, start, end):
+        self.kinds.append(kind)
+        self.starts.append(start)
+        self.ends.append(end)
+
+    def text(self, i):
+        text = self.source[self.starts[i]:self.ends[i]]
+        if self.kinds[i] == _IDENT:
+            return sys.intern(text)
+        return text
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def __getitem__(self, i):
+        return Token(TokenKind(self.kinds[i]), self.text(i), self.starts[i], self.ends[i])
+
+    def __iter__(self):
+        for i in range(len(self.kinds)):
+            yield self[i]
+
+    def __eq__(self, other):
+        if not isinstance(other, TokenBuffer):
+            return NotImplemented
+        return (
+            self.source == other.source
+            and self.kinds == other.kinds
+            and self.starts == other.starts
+            and self.ends == other.ends
+        )
+
+    def to_pairs(self):
+        """Return the legacy list of `(type_name, text)` tuples."""
+        names = [kind.name for kind in TokenKind]
+        return [(names[self.kinds[i]], self.text(i)) for i in range(len(self.kinds))]
@@ -0,0 +1,43 @@
+from src.lexer import lexer
+from src.parser import Parser
+from src.cse import CSEInterpreter, find_common_subexpressions
+
+
+def parse(code):
+    return Parser(lexer(code), hash_cons=True).parse()
+
+
+def run(code, env=None):
+    ast = parse(code)
+    out = []
+    it = CSEInterpreter(ast, env=env, output=lambda v: out.append(str(v)))
+    it.eval(ast)
+    return out, it
+
+
+def test_finds_repeated_expressions_only():
+    ast = parse('{ print(a * a + 1); print(a * a); print(b - 1); }')
+    common = find_common_subexpressions(ast)
+
+    assert len(common) == 1
+    (node, names), = common.items()
+    assert node.op == "*"
+    assert names == frozenset({"a"})
+
+
+def test_reuses_value_when_inputs_unchanged():
+    out, it = run('{ h = 3; print(h * h); print(h * h + 1); }')
+    assert out == ["9", "10"]
+    assert it.cache_hits == 1
+
+
+def test_recomputes_after_reassignment():
+    out, it = run('{ h = 3; print(h * h); h = 4; print(h * h); }')
+    assert out == ["9", "16"]
+    assert it.cache_hits == 0
+
+
+def test_recomputes_after_leaving_shadowing_block():
+    out, it = run('{ x = 2; { x = 5; print(x * x); } print(x * x); }')
+    assert out == ["25", "4"]
+    assert it.cache_hits == 0
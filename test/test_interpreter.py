@@ -4,11 +4,15 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from src.lexer import lexer
 from src.parser import Parser
 
+import asyncio
+
 import pytest
 
 from src.lexer import lexer
 from src.parser import Parser
-from src.interpreter import interpret
+from src.interpreter import interpret, run_async, specialize, StepBudgetExceeded, DeadlineExceeded
+from src.main import parse_vars
+from src.semantic import SemanticAnalyzer
 
 
 def parse(code):
@@ -92,3 +96,169 @@ def test_assignment_and_update():
     out, writer = capture_output()
     interpret(ast, output=writer)
     assert out == ["5", "7"]
+
+
+def test_array_elementwise_arithmetic():
+    code = """
+    {
+        w = [60, 72, 85];
+        print(w * 2 + [1, 2, 3]);
+        print(w > 70);
+        print(w[1]);
+    }
+    """
+
+    ast = parse(code)
+    out, writer = capture_output()
+    interpret(ast, output=writer)
+    assert out == ["[121, 146, 173]", "[False, True, True]", "72"]
+
+
+def test_array_length_mismatch_raises():
+    ast = parse('{ print([1, 2] + [1, 2, 3]); }')
+    out, writer = capture_output()
+    with pytest.raises(RuntimeError):
+        interpret(ast, output=writer)
+
+
+def test_array_from_env():
+    ast = parse('{ print(xs / 2); }')
+    out, writer = capture_output()
+    interpret(ast, env=parse_vars(["xs=1,2,3"]), output=writer)
+    assert out == ["[0.5, 1.0, 1.5]"]
+
+
+def test_parse_vars_numbers():
+    env = parse_vars(["n=3", "x=1.5", "xs=1.5,2", "s=hi", "t=1,a"])
+    assert env["n"] == 3 and isinstance(env["n"], int)
+    assert env["x"] == 1.5
+    assert env["xs"].typecode == "d" and list(env["xs"]) == [1.5, 2.0]
+    assert env["s"] == "hi"
+    assert env["t"] == "1,a"
+
+
+def test_precedence_and_unary_minus():
+    code = """
+    {
+        print(1 + 2 * 3);
+        print(10 - 4 - 3);
+        print(-2 * 3 + 10);
+        print(-[1, 2] * 2);
+    }
+    """
+
+    ast = parse(code)
+    out, writer = capture_output()
+    interpret(ast, output=writer)
+    assert out == ["7", "3", "4", "[-2, -4]"]
+
+
+def test_run_async_output_and_yields():
+    ast = parse("{ x = 1; " + "x = x + 1; " * 50 + "print(x); }")
+    out, writer = capture_output()
+
+    async def main():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        task = asyncio.create_task(ticker())
+        await run_async(ast, step_budget=1000, yield_every=10, output=writer)
+        task.cancel()
+        return ticks
+
+    ticks = asyncio.run(main())
+    assert out == ["51"]
+    assert ticks > 1
+
+
+def test_run_async_step_budget_exceeded():
+    ast = parse("{ x = 1; " + "x = x + 1; " * 50 + "}")
+    with pytest.raises(StepBudgetExceeded):
+        asyncio.run(run_async(ast, step_budget=20, yield_every=5))
+
+
+def test_run_async_deadline_exceeded():
+    ast = parse("{ x = 1; " + "x = x + 1; " * 50 + "}")
+    with pytest.raises(DeadlineExceeded):
+        asyncio.run(run_async(ast, yield_every=1, timeout=-1))
+
+
+def test_builtin_calls():
+    code = """
+    {
+        bmi = 68 / (170 * 170 / 10000);
+        print(round(bmi, 1));
+        print(format("{:.2f} kg", 6825 / 100));
+        print(max(3, abs(-7), 5));
+        print(min([4, 2, 9]));
+        print(sqrt(16) + len("four"));
+    }
+    """
+
+    ast = parse(code)
+    out, writer = capture_output()
+    interpret(ast, output=writer)
+    assert out == ["23.5", "68.25 kg", "7", "2", "8.0"]
+
+
+def test_unknown_builtin_raises():
+    ast = parse('{ print(nope(1)); }')
+    out, writer = capture_output()
+    with pytest.raises(RuntimeError):
+        interpret(ast, output=writer)
+
+
+def test_builtin_runtime_type_errors():
+    out, writer = capture_output()
+    interpret(parse('{ print(round(29 / 4, 4 / 2)); }'), output=writer)
+    assert out == ["7.25"]
+
+    env = parse_vars(["xs=1,2,3", "s=hi"])
+    for code in ('{ print(round(7, 1 / 2)); }', '{ print(sqrt(xs)); }', '{ print(abs(xs)); }',
+                 '{ print(round(xs)); }', '{ print(max(s, 1)); }', '{ print(len(n)); }'):
+        with pytest.raises(RuntimeError):
+            interpret(parse(code), env=dict(env, n=5), output=writer)
+
+
+def test_specialized_evaluation_matches_generic():
+    code = '{ x = 2 * 3 + 1; print(x > 5); print("a" == "a"); print(g + x); }'
+    ast = parse(code)
+    SemanticAnalyzer(known_globals={"g"}).analyze(ast)
+    specialize(ast)
+
+    assign = ast.statements[0].expr
+    assert assign.evaluate is not None
+    assert assign.left.evaluate is not None
+    assert ast.statements[2].expr.evaluate is not None
+    # 'g' comes from the runtime env: its type is unknown, so no fast path
+    assert ast.statements[3].expr.evaluate is None
+    assert ast.statements[3].expr.left.evaluate is None
+
+    out, writer = capture_output()
+    interpret(ast, env={"g": 10}, output=writer)
+    assert out == ["True", "True", "17"]
+
+
+def test_array_if_condition_raises():
+    for code in ('{ if (xs > 1) { print(1); } }', '{ if (xs == 1) { print(1); } }'):
+        ast = parse(code)
+        out, writer = capture_output()
+        with pytest.raises(RuntimeError):
+            interpret(ast, env=parse_vars(["xs=1,2,3"]), output=writer)
+        assert out == []
+
+
+def test_array_overflow_raises_runtime_error():
+    for code in ('{ print([3037000500] * [3037000500]); }', '{ print([10000000000 * 10000000000]); }'):
+        ast = parse(code)
+        out, writer = capture_output()
+        with pytest.raises(RuntimeError):
+            interpret(ast, output=writer)
+
+    with pytest.raises(ValueError):
+        parse_vars(["x=99999999999999999999,1"])
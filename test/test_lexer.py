@@ -1,3 +1,5 @@
+import pytest
+
 from src.lexer import lexer
 
 
@@ -12,3 +14,42 @@ def test_lexer_tokens():
     ]
 
     assert tokens == expected
+
+
+def test_parallel_lexer_matches_serial():
+    from src.lexer import lex_parallel, lex_serial, find_split_points
+
+    unit = (
+        '{\n x = 5; // comment with "quote\n'
+        ' s = "multi\nline // not a comment";\n'
+        ' /* block\n comment with "quote */\n'
+        ' if (x >= 10) { print(s); }\n}\n'
+    )
+    code = unit * 50
+
+    points = find_split_points(code, 40)
+    assert len(points) > 3
+    assert lex_parallel(code, workers=2, chunk_size=40) == lex_serial(code)
+
+
+def test_parallel_lexer_reports_absolute_index():
+    from src.lexer import lex_parallel
+
+    code = "x = 1;\n" * 20 + "y = @;\n"
+    with pytest.raises(SyntaxError, match=f"index {code.index('@')}"):
+        lex_parallel(code, workers=2, chunk_size=16)
+
+
+def test_tokenize_buffer_offsets_and_interning():
+    from src.lexer import tokenize
+    from src.tokens import Token, TokenKind
+
+    code = 'total = total + 1; // sum\nprint(total);'
+    buf = tokenize(code)
+
+    assert buf[0] == Token(TokenKind.IDENT, "total", 0, 5)
+    assert buf[4] == Token(TokenKind.NUMBER, "1", 16, 17)
+    assert buf[6].kind == TokenKind.KEYWORD
+    assert buf[6].start == code.index("print")
+    assert buf.text(0) is buf.text(2) is buf.text(8)
+    assert buf.to_pairs() == lexer(code)
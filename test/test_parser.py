@@ -1,6 +1,6 @@
 import pytest
 
-from src.lexer import lexer
+from src.lexer import lexer, tokenize
 from src.parser import Parser
 from src.ast_nodes import (
     BlockNode,
@@ -51,3 +51,73 @@ def test_parse_if_print():
 
     assert isinstance(else_block.statements[0], PrintNode)
     assert else_block.statements[0].expr.value == '"You are not an adult"'
+
+
+def test_parse_array_literal_and_index():
+    from src.ast_nodes import ArrayLiteralNode, IndexNode, AssignmentNode
+
+    ast = Parser(lexer('{ a = [1, x, 3]; print(a[2]); }')).parse()
+
+    assign = ast.statements[0]
+    assert isinstance(assign, AssignmentNode)
+    assert isinstance(assign.expr, ArrayLiteralNode)
+    assert len(assign.expr.elements) == 3
+    assert isinstance(assign.expr.elements[1], IdentifierNode)
+
+    index = ast.statements[1].expr
+    assert isinstance(index, IndexNode)
+    assert index.target.name == "a"
+    assert index.index.value == 2
+
+
+def test_operator_precedence():
+    ast = Parser(lexer('{ print(a + b * c == d - e / f); }')).parse()
+    eq = ast.statements[0].expr
+
+    assert eq.op == "=="
+    assert eq.left.op == "+"
+    assert eq.left.left.name == "a"
+    assert eq.left.right.op == "*"
+    assert eq.right.op == "-"
+    assert eq.right.right.op == "/"
+
+
+def test_left_associativity_and_unary_minus():
+    from src.ast_nodes import UnaryOpNode
+
+    ast = Parser(lexer('{ print(a - b - c); print(-x * -2); }')).parse()
+
+    sub = ast.statements[0].expr
+    assert sub.op == "-"
+    assert sub.left.op == "-"
+    assert sub.right.name == "c"
+
+    mul = ast.statements[1].expr
+    assert mul.op == "*"
+    assert isinstance(mul.left, UnaryOpNode)
+    assert mul.left.operand.name == "x"
+    assert isinstance(mul.right, LiteralNode)
+    assert mul.right.value == -2
+
+
+def test_hash_cons_shares_identical_subtrees():
+    code = '{ a = h * h; b = h * h + 1; if (h * h > 2) { print(h * h); } }'
+    ast = Parser(lexer(code), hash_cons=True).parse()
+
+    first = ast.statements[0].expr
+    assert ast.statements[1].expr.left is first
+    assert ast.statements[2].condition.left is first
+    assert ast.statements[2].then_block.statements[0].expr is first
+
+    plain = Parser(lexer(code)).parse()
+    assert plain.statements[1].expr.left is not plain.statements[0].expr
+
+
+def test_parser_consumes_token_buffer():
+    code = '{ x = 1 + 2 * 3; if (x > 2) { print(x); } }'
+    from_buffer = Parser(tokenize(code)).parse()
+    from_pairs = Parser(lexer(code)).parse()
+
+    assert from_buffer.statements[0].expr.right.op == "*"
+    assert from_pairs.statements[0].expr.right.op == "*"
+    assert from_buffer.statements[1].then_block.statements[0].expr.name == "x"
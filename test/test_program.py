@@ -0,0 +1,86 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.program import compile_program
+from src.semantic import SemanticError
+
+
+SOURCE = """
+{
+    bmi = weight / (height * height / 10000);
+    if (bmi < 25) {
+        print(format("{} ok", weight));
+    } else {
+        print(format("{} high", weight));
+    }
+}
+"""
+
+
+def test_program_runs_many_envs_concurrently():
+    program = compile_program(SOURCE, known_globals={"weight", "height"})
+
+    def run(weight):
+        out = []
+        program.run({"weight": weight, "height": 170}, output=out.append)
+        return out
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(run, range(40, 120)))
+
+    for weight, out in zip(range(40, 120), results):
+        bmi = weight / (170 * 170 / 10000)
+        assert out == [f"{weight} ok" if bmi < 25 else f"{weight} high"]
+
+
+def test_program_is_immutable():
+    program = compile_program('{ print(1); }')
+    with pytest.raises(AttributeError):
+        program.ast = None
+
+
+def test_compile_program_reports_semantic_errors():
+    with pytest.raises(SemanticError):
+        compile_program('{ print(1 + "x"); }')
+
+
+@pytest.mark.parametrize("source, var_args", [
+    # the inner assignments declare block-local names; the outer x and a stay arrays
+    ('{ x = [1, 2, 3]; if (1 == 1) { x = 5; } print(x * 2); print(x + x); print(-x); }', []),
+    ('{ a = [1, 2, 3]; { a = [1, 2]; } print(a + [1, 2, 3]); }', []),
+    ('{ print((x == 1) == (x == 2)); print(-x); }', ["x=1,2,3"]),
+    ('{ a = 2; s = "hi"; print(a * 3 - 1 > 4); print(s == "hi"); print(-a); }', []),
+])
+def test_compiled_program_matches_interpret(source, var_args):
+    from src.interpreter import interpret
+    from src.lexer import lexer
+    from src.main import parse_vars
+    from src.parser import Parser
+
+    env = parse_vars(var_args)
+
+    compiled = []
+    compile_program(source, known_globals=set(env)).run(dict(env), output=lambda v: compiled.append(str(v)))
+
+    plain = []
+    interpret(Parser(lexer(source)).parse(), env=dict(env), output=lambda v: plain.append(str(v)))
+
+    assert compiled == plain
+
+
+def test_compile_program_with_cse():
+    source = '{ h = 3; print(h * h); print(h * h + 1); { h = 4; print(h * h); } print(h * h > 8); }'
+    program = compile_program(source, cse=True)
+
+    assert [node.op for node in program.common] == ["*"]
+
+    def run(_):
+        out = []
+        program.run(output=lambda v: out.append(str(v)))
+        return out
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(run, range(20)))
+
+    assert all(out == ["9", "10", "16", "True"] for out in results)
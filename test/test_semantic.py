@@ -58,3 +58,78 @@ def test_assignment_type_error_on_use():
     analyzer = SemanticAnalyzer()
     with pytest.raises(SemanticError):
         analyzer.analyze(ast)
+
+
+def test_array_ops_ok():
+    ast = parse('{ a = [1, 2, 3]; print(a * 2 + [4, 5, 6]); print(a[0] + 1); }')
+    analyzer = SemanticAnalyzer()
+    analyzer.analyze(ast)
+    assert analyzer.symbols.get('a') == 'array'
+
+
+def test_array_shape_mismatch_raises():
+    ast = parse('{ a = [1, 2, 3]; print(a + [1, 2]); }')
+    analyzer = SemanticAnalyzer()
+    with pytest.raises(SemanticError):
+        analyzer.analyze(ast)
+
+
+def test_array_string_element_raises():
+    ast = parse('{ a = [1, "two"]; }')
+    analyzer = SemanticAnalyzer()
+    with pytest.raises(SemanticError):
+        analyzer.analyze(ast)
+
+
+def test_builtin_call_resolved_and_typed():
+    from src.runtime import BUILTINS
+
+    ast = parse('{ x = sqrt(16); print(x + 1); }')
+    analyzer = SemanticAnalyzer()
+    analyzer.analyze(ast)
+    assert analyzer.symbols.get('x') == 'number'
+    assert ast.statements[0].expr.func is BUILTINS['sqrt'].func
+
+
+def test_builtin_argument_errors():
+    for code in ('{ print(sqrt("hi")); }', '{ print(sqrt(1, 2)); }', '{ print(nope(1)); }'):
+        with pytest.raises(SemanticError):
+            SemanticAnalyzer().analyze(parse(code))
+
+
+def test_static_types_attached_to_nodes():
+    ast = parse('{ x = 1 + 2; print(x == 3); print(y); }')
+    SemanticAnalyzer().analyze(ast)
+
+    assert ast.statements[0].expr.static_type == 'number'
+    assert ast.statements[1].expr.static_type == 'bool'
+    assert ast.statements[2].expr.static_type == 'unknown'
+
+
+def test_shared_node_with_conflicting_types_is_unknown():
+    from src.lexer import lexer
+    from src.parser import Parser
+
+    ast = Parser(lexer('{ x = 1; print(x == x); x = "s"; print(x == x); }'), hash_cons=True).parse()
+    SemanticAnalyzer().analyze(ast)
+
+    shared = ast.statements[1].expr
+    assert shared is ast.statements[3].expr
+    assert shared.left.static_type == 'unknown'
+
+
+def test_equality_with_unknown_operand_is_unknown():
+    ast = parse('{ print(xs == 1); }')
+    SemanticAnalyzer().analyze(ast)
+    assert ast.statements[0].expr.static_type == 'unknown'
+
+
+def test_nested_block_assignments_are_scoped():
+    ast = parse('{ a = [1, 2, 3]; { a = [1, 2]; print(a * 2); } print(a + [1, 2, 3]); }')
+    analyzer = SemanticAnalyzer()
+    analyzer.analyze(ast)
+    assert analyzer.symbols.get('a') == 'array'
+
+    ast = parse('{ x = [1, 2]; if (1 == 1) { x = 5; } print(x * 2); }')
+    SemanticAnalyzer().analyze(ast)
+    assert ast.statements[2].expr.static_type == 'array'